@@ -0,0 +1,27 @@
+"""
+Django app configuration for the core package.
+"""
+
+import time
+
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    """App config for core infrastructure."""
+
+    name = "core"
+
+    def ready(self) -> None:
+        """
+        Initialize application-level metrics.
+
+        Runs once after Django setup, keeping version metadata (and the
+        Celery import it pulls in) out of the metrics module's import
+        graph.
+        """
+        from core.middleware.metrics import app_info, app_start_time
+        from pulsewatch import __version__
+
+        app_info.labels(version=__version__).set(1)
+        app_start_time.set(time.time())
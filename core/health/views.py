@@ -4,31 +4,42 @@ Health check views for PulseWatch.
 Provides /healthz (liveness) and /ready (readiness) endpoints.
 """
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime, timezone
 from typing import Any, Dict
 
 import structlog
-from django.http import JsonResponse
-from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import AllowAny
-from rest_framework.request import Request
-from rest_framework.response import Response
+from django.http import HttpRequest
+from django.views.decorators.http import require_GET
 
 from core.health.checks import database_health_check, redis_health_check
+from core.utils.responses import OrjsonResponse
 from pulsewatch import __version__
 
 logger = structlog.get_logger(__name__)
 
+# Per-check wall-clock deadline (seconds). A hung dependency must not stall
+# the readiness endpoint indefinitely.
+HEALTH_CHECK_TIMEOUT = 2.0
 
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def healthz_view(request: Request) -> Response:
+# Module-level executor so each request reuses the same worker threads
+# instead of paying thread creation cost per probe.
+_health_check_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="health-check")
+
+
+@require_GET
+def healthz_view(request: HttpRequest) -> OrjsonResponse:
     """
     Liveness probe endpoint.
 
     Returns 200 OK if the application process is running.
     Does not check dependencies - only verifies the service is alive.
 
+    Implemented as a plain Django view (no DRF content negotiation or
+    renderer machinery) to keep the probe path cheap.
+
     Response schema (per contracts/health.yaml):
     {
         "status": "healthy",
@@ -38,24 +49,27 @@ def healthz_view(request: Request) -> Response:
     """
     response_data = {
         "status": "healthy",
-        "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        # orjson renders tz-aware datetimes as Z-suffixed ISO 8601
+        "timestamp": datetime.now(timezone.utc),
         "version": __version__,
     }
 
     logger.info("healthz_check", status="healthy")
 
-    return Response(response_data, status=200)
+    return OrjsonResponse(response_data, status=200)
 
 
-@api_view(["GET"])
-@permission_classes([AllowAny])
-def ready_view(request: Request) -> Response:
+@require_GET
+def ready_view(request: HttpRequest) -> OrjsonResponse:
     """
     Readiness probe endpoint.
 
     Returns 200 OK if the application is ready to serve traffic.
     Checks all critical dependencies (database, Redis).
 
+    Implemented as a plain Django view (no DRF content negotiation or
+    renderer machinery) to keep the probe path cheap.
+
     Response schema (per contracts/health.yaml):
     {
         "status": "ready" | "not_ready",
@@ -75,12 +89,37 @@ def ready_view(request: Request) -> Response:
         }
     }
     """
-    # Run all health checks
-    checks = {
-        "database": database_health_check(),
-        "redis": redis_health_check(),
+    # orjson renders tz-aware datetimes as Z-suffixed ISO 8601
+    timestamp = datetime.now(timezone.utc)
+
+    # Run all health checks concurrently so endpoint latency is bounded by
+    # the slowest check rather than the sum of all checks.
+    futures = {
+        "database": _health_check_executor.submit(database_health_check),
+        "redis": _health_check_executor.submit(redis_health_check),
     }
 
+    # One shared deadline for all waits: the checks run concurrently, so
+    # the endpoint should answer within HEALTH_CHECK_TIMEOUT overall, not
+    # HEALTH_CHECK_TIMEOUT per sequential result() call.
+    deadline = time.monotonic() + HEALTH_CHECK_TIMEOUT
+
+    checks: Dict[str, Dict[str, Any]] = {}
+    for check_name, future in futures.items():
+        try:
+            checks[check_name] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            logger.error(
+                "health_check_timeout",
+                check_name=check_name,
+                timeout_seconds=HEALTH_CHECK_TIMEOUT,
+            )
+            checks[check_name] = {
+                "status": "unhealthy",
+                "latency_ms": round(HEALTH_CHECK_TIMEOUT * 1000, 2),
+                "message": "check timed out",
+            }
+
     # Determine overall status
     all_healthy = all(check["status"] == "healthy" for check in checks.values())
 
@@ -89,7 +128,7 @@ def ready_view(request: Request) -> Response:
 
     response_data = {
         "status": overall_status,
-        "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "timestamp": timestamp,
         "version": __version__,
         "checks": checks,
     }
@@ -101,4 +140,4 @@ def ready_view(request: Request) -> Response:
         redis_status=checks["redis"]["status"],
     )
 
-    return Response(response_data, status=http_status)
+    return OrjsonResponse(response_data, status=http_status)
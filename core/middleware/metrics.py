@@ -4,7 +4,6 @@ Custom Prometheus metrics middleware for PulseWatch.
 Implements application-specific metrics on top of django-prometheus baseline.
 """
 
-import time
 from typing import Callable
 
 from django.http import HttpRequest, HttpResponse
@@ -31,15 +30,17 @@ health_check_status = Gauge(
 )
 
 # Request metrics (additional to django-prometheus)
-active_requests = Gauge(
-    "pulsewatch_active_requests", "Number of requests currently being processed"
+# Counter increments are lock-free fast paths, unlike Gauge updates.
+# In-flight requests = pulsewatch_requests_started_total -
+# pulsewatch_requests_finished_total (computed in PromQL).
+requests_started = Counter("pulsewatch_requests_started_total", "Total number of requests started")
+requests_finished = Counter(
+    "pulsewatch_requests_finished_total", "Total number of requests finished"
 )
 
-# Initialize app metrics
-from pulsewatch import __version__
-
-app_info.labels(version=__version__).set(1)
-app_start_time.set(time.time())
+# app_info / app_start_time are initialized in core.apps.CoreConfig.ready()
+# so that importing a metric symbol does not drag in the pulsewatch
+# package (and its Celery import) as a side effect.
 
 
 class MetricsMiddleware:
@@ -50,9 +51,15 @@ class MetricsMiddleware:
     Works alongside django-prometheus for comprehensive observability.
     """
 
+    __slots__ = ("get_response", "_inc_started", "_inc_finished")
+
     def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
         """Initialize middleware with the next middleware/view in the chain."""
         self.get_response = get_response
+        # Pre-bind counter increments so the per-request path pays one
+        # attribute lookup fewer.
+        self._inc_started = requests_started.inc
+        self._inc_finished = requests_finished.inc
 
     def __call__(self, request: HttpRequest) -> HttpResponse:
         """
@@ -64,12 +71,16 @@ class MetricsMiddleware:
         Returns:
             HttpResponse: The response from downstream middleware/view
         """
-        # Track active requests
-        active_requests.inc()
+        # Prometheus scrapes skip instrumentation; counting the scrape
+        # itself only distorts the request metrics
+        if request.path == "/metrics":
+            return self.get_response(request)
+
+        # Track in-flight requests via a lock-free counter pair
+        self._inc_started()
 
         try:
             response = self.get_response(request)
             return response
         finally:
-            # Decrement active requests counter
-            active_requests.dec()
+            self._inc_finished()
@@ -126,6 +126,7 @@ MEDIA_ROOT = BASE_DIR / "mediafiles"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # Cache configuration (Redis)
+REDIS_URL = env("REDIS_URL")
 CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.redis.RedisCache",
@@ -137,6 +138,11 @@ CACHES = {
 SESSION_ENGINE = "django.contrib.sessions.backends.cache"
 SESSION_CACHE_ALIAS = "default"
 
+# Health check configuration
+# Repeated probes within this window reuse the last result instead of
+# hitting the database/Redis again.
+HEALTH_CHECK_CACHE_TTL = env.int("HEALTH_CHECK_CACHE_TTL", default=5)
+
 # REST Framework configuration
 REST_FRAMEWORK = {
     "DEFAULT_RENDERER_CLASSES": [
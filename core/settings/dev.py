@@ -16,8 +16,10 @@ INSTALLED_APPS += [  # noqa: F405
     "django_extensions",  # Useful development tools (if installed)
 ]
 
-# Database - keep connection alive for development
-DATABASES["default"]["CONN_MAX_AGE"] = 0  # noqa: F405
+# Database - reuse connections across requests; the cheap preflight
+# check detects stale connections before they are handed out
+DATABASES["default"]["CONN_MAX_AGE"] = 60  # noqa: F405
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True  # noqa: F405
 
 # Email backend for development (console output)
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
@@ -13,8 +13,10 @@ DEBUG = False
 # Must be set properly in production
 ALLOWED_HOSTS = env.list("ALLOWED_HOSTS")  # noqa: F405
 
-# Database - persistent connections for production
+# Database - persistent connections for production, with a cheap
+# preflight check so stale connections are detected before reuse
 DATABASES["default"]["CONN_MAX_AGE"] = 600  # noqa: F405
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True  # noqa: F405
 DATABASES["default"]["OPTIONS"] = {  # noqa: F405
     "init_command": "SET sql_mode='STRICT_TRANS_TABLES'",
     "charset": "utf8mb4",
@@ -59,11 +61,20 @@ CELERY_TASK_ALWAYS_EAGER = False
 # Cache - longer TTLs for production
 CACHES["default"]["TIMEOUT"] = 300  # noqa: F405
 
-# Logging - JSON format for production (will be enhanced with structlog)
-LOGGING["formatters"]["json"] = {  # noqa: F405
-    "format": "%(levelname)s %(asctime)s %(module)s %(message)s",
+# Logging - JSON format for production. The base settings already define
+# a structlog ProcessorFormatter "json" formatter (JSONRenderer, no
+# per-record %-interpolation); rebuild the dict via unpacking so
+# dictConfig receives one final config instead of a mutated base dict.
+LOGGING = {  # noqa: F405
+    **LOGGING,  # noqa: F405
+    "handlers": {
+        **LOGGING["handlers"],  # noqa: F405
+        "console": {
+            **LOGGING["handlers"]["console"],  # noqa: F405
+            "formatter": "json",
+        },
+    },
 }
-LOGGING["handlers"]["console"]["formatter"] = "json"  # noqa: F405
 
 # Admin site header
 ADMIN_SITE_HEADER = "PulseWatch Administration"
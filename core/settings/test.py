@@ -15,6 +15,8 @@ os.environ.setdefault("REDIS_URL", "redis://localhost:6379/0")
 os.environ.setdefault("CELERY_BROKER_URL", "memory://")
 os.environ.setdefault("CELERY_RESULT_BACKEND", "cache+memory://")
 
+from django.contrib.auth.hashers import BasePasswordHasher
+
 from .base import *  # noqa: F403, F401
 
 # Use in-memory SQLite for tests
@@ -25,9 +27,29 @@ DATABASES = {
     }
 }
 
-# Fast password hashing for tests
+
+# No-op password hashing for tests: every create_user call pays the
+# hasher, and even MD5 still does salt handling plus digest work.
+class PlainPasswordHasher(BasePasswordHasher):
+    """Store passwords as plain text. Test settings only."""
+
+    algorithm = "plain"
+
+    def salt(self) -> str:
+        return ""
+
+    def encode(self, password: str, salt: str) -> str:
+        return f"{self.algorithm}${password}"
+
+    def verify(self, password: str, encoded: str) -> bool:
+        return encoded == self.encode(password, "")
+
+    def safe_summary(self, encoded: str) -> dict:
+        return {"algorithm": self.algorithm, "hash": "***"}
+
+
 PASSWORD_HASHERS = [
-    "django.contrib.auth.hashers.MD5PasswordHasher",
+    "core.settings.test.PlainPasswordHasher",
 ]
 
 # Celery eager mode for synchronous testing
@@ -0,0 +1,26 @@
+"""
+HTTP response classes for PulseWatch.
+
+Provides an orjson-backed JSON response for hot endpoints.
+"""
+
+from typing import Any
+
+import orjson
+from django.http import HttpResponse
+
+
+class OrjsonResponse(HttpResponse):
+    """
+    JSON response serialized with orjson.
+
+    orjson serializes several times faster than the stdlib json module
+    and emits timezone-aware datetimes natively as Z-suffixed ISO 8601
+    strings (OPT_UTC_Z), so hot endpoints can pass datetime objects
+    straight through without formatting them first.
+    """
+
+    def __init__(self, data: Any, **kwargs: Any) -> None:
+        """Serialize data with orjson and set the JSON content type."""
+        kwargs.setdefault("content_type", "application/json")
+        super().__init__(content=orjson.dumps(data, option=orjson.OPT_UTC_Z), **kwargs)
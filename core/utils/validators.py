@@ -5,12 +5,18 @@ Provides reusable validators for models and forms.
 """
 
 import re
-from typing import Any
+from typing import Any, Sequence
 from urllib.parse import urlparse
 
 from django.core.exceptions import ValidationError
 from django.core.validators import URLValidator
 
+# Compiled once at import so hot validation paths (e.g. bulk monitor
+# imports) skip the re-cache lookup per field.
+CRON_FIELD_RE = re.compile(r"^(\*|[0-9]+([-/,][0-9]+)*|\*/[0-9]+)$")
+
+_VALID_CRON_LENGTHS = frozenset({5, 6})
+
 
 def validate_url(value: str) -> None:
     """
@@ -67,13 +73,12 @@ def validate_cron_expression(value: str) -> None:
         ValidationError: If the cron expression is invalid
     """
     parts = value.split()
-    if len(parts) not in [5, 6]:
+    if len(parts) not in _VALID_CRON_LENGTHS:
         raise ValidationError("Cron expression must have 5 or 6 fields")
 
     # Basic validation of each field (not comprehensive)
-    cron_pattern = r"^(\*|[0-9]+([-/,][0-9]+)*|\*/[0-9]+)$"
     for part in parts:
-        if not re.match(cron_pattern, part):
+        if not CRON_FIELD_RE.match(part):
             raise ValidationError(f"Invalid cron field: {part}")
 
 
@@ -91,13 +96,14 @@ def validate_timeout(value: int) -> None:
         raise ValidationError(f"Timeout must be positive, got: {value}")
 
 
-def validate_json_structure(value: Any, required_keys: list[str]) -> None:
+def validate_json_structure(value: Any, required_keys: Sequence[str]) -> None:
     """
     Validate that a dictionary contains required keys.
 
     Args:
         value: The dictionary to validate
-        required_keys: List of required key names
+        required_keys: Required key names; callers on hot paths can share
+            a module-level tuple instead of rebuilding a list per call
 
     Raises:
         ValidationError: If required keys are missing
@@ -105,6 +111,7 @@ def validate_json_structure(value: Any, required_keys: list[str]) -> None:
     if not isinstance(value, dict):
         raise ValidationError("Value must be a dictionary")
 
-    missing_keys = set(required_keys) - set(value.keys())
+    # dict membership is O(1); avoids building two throwaway sets per call
+    missing_keys = [key for key in required_keys if key not in value]
     if missing_keys:
         raise ValidationError(f'Missing required keys: {", ".join(missing_keys)}')
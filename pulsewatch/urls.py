@@ -8,11 +8,15 @@ The `urlpatterns` list routes URLs to views. For more information please see:
 from django.contrib import admin
 from django.urls import include, path
 
+from core.health.views import healthz_view, ready_view
+
 urlpatterns = [
     # Admin site
     path("admin/", admin.site.urls),
     # Prometheus metrics endpoint
     path("", include("django_prometheus.urls")),
-    # Health check endpoints
-    path("", include("core.health.urls")),
+    # Health check endpoints, mounted directly so the resolver walks one
+    # node per probe instead of descending into an included urlconf
+    path("healthz/", healthz_view, name="healthz"),
+    path("ready/", ready_view, name="ready"),
 ]
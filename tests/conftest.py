@@ -17,20 +17,53 @@ def django_client() -> Client:
     return Client()
 
 
+@pytest.fixture(scope="session")
+def urls() -> dict:
+    """Cache reverse() lookups for the health endpoints once per session."""
+    from django.urls import reverse
+
+    return {"healthz": reverse("healthz"), "ready": reverse("ready")}
+
+
 @pytest.fixture
+def unhealthy_ready_response(api_client: APIClient, urls: dict, monkeypatch):
+    """
+    Issue one /ready GET with the database check mocked as unhealthy.
+
+    Shared by the contract and integration unhealthy-path tests so the
+    patch and request happen once instead of being duplicated.
+    """
+    monkeypatch.setattr(
+        "core.health.views.database_health_check",
+        lambda: {
+            "status": "unhealthy",
+            "latency_ms": 5000.0,
+            "message": "Database connection failed: Connection refused",
+        },
+    )
+    return api_client.get(urls["ready"])
+
+
+@pytest.fixture(scope="session")
 def api_client() -> APIClient:
-    """Provide a DRF API client."""
+    """Provide a DRF API client, shared across the session.
+
+    The client is stateless between requests, so constructing it once
+    amortizes setup cost across the suite. Tests needing credentials use
+    authenticated_client, which builds its own client.
+    """
     return APIClient()
 
 
 @pytest.fixture
-def authenticated_client(api_client: APIClient, django_user_model) -> APIClient:
+def authenticated_client(django_user_model) -> APIClient:
     """Provide an authenticated API client with a test user."""
     user = django_user_model.objects.create_user(
         username="testuser", email="test@example.com", password="testpass123"
     )
-    api_client.force_authenticate(user=user)
-    return api_client
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
 
 
 @pytest.fixture
@@ -62,10 +95,13 @@ def celery_config():
 
 @pytest.fixture(autouse=True)
 def _clear_cache(settings):
-    """Clear cache before each test."""
+    """Clear caches before each test."""
     from django.core.cache import cache
 
+    from core.health.checks import clear_health_check_cache
+
     cache.clear()
+    clear_health_check_cache()
 
 
 @pytest.fixture
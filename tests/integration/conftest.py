@@ -0,0 +1,19 @@
+"""
+Pytest fixtures for integration tests.
+"""
+
+import pytest
+from django.db import connection
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _verify_db_connection(django_db_setup, django_db_blocker):
+    """
+    One-time database connectivity smoke check for the session.
+
+    Replaces the old per-test SELECT 1 test; downstream integration tests
+    can assume the database is reachable.
+    """
+    with django_db_blocker.unblock(), connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+        assert cursor.fetchone() == (1,)
@@ -6,25 +6,13 @@ Verifies that Django can connect to and query the database.
 
 import pytest
 from django.contrib.auth import get_user_model
-from django.db import connection
 
 
 @pytest.mark.integration
-@pytest.mark.django_db
 class TestDatabaseConnectivity:
     """Test database connection and basic operations."""
 
-    def test_database_connection(self):
-        """
-        Test that Django can connect to the database.
-
-        Verifies basic database connectivity using raw SQL.
-        """
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT 1")
-            result = cursor.fetchone()
-            assert result == (1,)
-
+    @pytest.mark.django_db
     def test_database_create_and_query_user(self):
         """
         Test that we can create and query a user in the database.
@@ -33,10 +21,11 @@ class TestDatabaseConnectivity:
         """
         User = get_user_model()
 
-        # Create a test user
-        user = User.objects.create_user(
-            username="dbtest", email="dbtest@example.com", password="testpass123"
-        )
+        # Create a test user; an unusable password skips the hashing step,
+        # which is not what this test covers
+        user = User(username="dbtest", email="dbtest@example.com")
+        user.set_unusable_password()
+        user.save()
 
         # Verify user was created
         assert user.id is not None
@@ -48,6 +37,7 @@ class TestDatabaseConnectivity:
         assert retrieved_user.id == user.id
         assert retrieved_user.email == user.email
 
+    @pytest.mark.django_db
     def test_database_transaction_rollback(self):
         """
         Test that database transactions work correctly.
@@ -56,10 +46,11 @@ class TestDatabaseConnectivity:
         """
         User = get_user_model()
 
-        # Create a user in this test
-        User.objects.create_user(
-            username="transactiontest", email="transaction@example.com", password="testpass123"
-        )
+        # Create a user in this test; no password hashing needed to prove
+        # rollback works
+        user = User(username="transactiontest", email="transaction@example.com")
+        user.set_unusable_password()
+        user.save()
 
         # Verify user exists in this transaction
         assert User.objects.filter(username="transactiontest").exists()
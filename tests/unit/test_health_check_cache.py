@@ -0,0 +1,74 @@
+"""
+Unit tests for the health-check result cache.
+
+Verifies the short-TTL memoization in core.health.checks.
+"""
+
+import pytest
+
+from core.health.checks import _cached_check, clear_health_check_cache
+
+
+@pytest.mark.unit
+class TestHealthCheckCache:
+    """Unit tests for _cached_check TTL memoization."""
+
+    def setup_method(self) -> None:
+        """Start each test with an empty cache."""
+        clear_health_check_cache()
+
+    def test_cache_hit_skips_probe(self, settings) -> None:
+        """A second call within the TTL must not re-run the probe."""
+        settings.HEALTH_CHECK_CACHE_TTL = 60
+        calls = []
+
+        def probe():
+            calls.append(1)
+            return {"status": "healthy", "latency_ms": 1.0, "message": "ok"}
+
+        first = _cached_check("test", probe)
+        second = _cached_check("test", probe)
+
+        assert len(calls) == 1
+        assert first is second
+
+    def test_expired_entry_reruns_probe(self, settings) -> None:
+        """A zero TTL means every call runs the real probe."""
+        settings.HEALTH_CHECK_CACHE_TTL = 0
+        calls = []
+
+        def probe():
+            calls.append(1)
+            return {"status": "healthy", "latency_ms": 1.0, "message": "ok"}
+
+        _cached_check("test", probe)
+        _cached_check("test", probe)
+
+        assert len(calls) == 2
+
+    def test_unhealthy_results_are_cached(self, settings) -> None:
+        """Unhealthy results are cached too, so a flapping backend is not hammered."""
+        settings.HEALTH_CHECK_CACHE_TTL = 60
+        calls = []
+
+        def probe():
+            calls.append(1)
+            return {"status": "unhealthy", "latency_ms": 1.0, "message": "down"}
+
+        _cached_check("test", probe)
+        result = _cached_check("test", probe)
+
+        assert len(calls) == 1
+        assert result["status"] == "unhealthy"
+
+    def test_cache_is_keyed_per_check(self, settings) -> None:
+        """Different check names do not share cached results."""
+        settings.HEALTH_CHECK_CACHE_TTL = 60
+
+        db = _cached_check("db", lambda: {"status": "healthy", "latency_ms": 1.0, "message": "db"})
+        redis = _cached_check(
+            "redis", lambda: {"status": "healthy", "latency_ms": 1.0, "message": "redis"}
+        )
+
+        assert db["message"] == "db"
+        assert redis["message"] == "redis"